@@ -1,20 +1,57 @@
+import hashlib
+
 from django.contrib import admin
+from django.contrib.admin.views.main import ORDER_VAR
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
 from django.utils.html import format_html
-from .models import Profile, Blog, Category, Favorite, Rating, ContactMessage, Comment
+from .models import Profile, Blog, Category, Favorite, Rating, ContactMessage, Comment, get_cached_categories
+from .paginators import EstimatedCountPaginator
+
+
+def _cached_file_url(file):
+    """
+    Returns file.url, cached for five minutes. Remote storages such as S3 sign
+    a URL on every call; the TTL stays well inside typical signature expiry.
+    """
+    key = 'file_url:' + hashlib.md5(file.name.encode()).hexdigest()
+    return cache.get_or_set(key, lambda: file.url, 300)
+
+
+class CategoryListFilter(admin.SimpleListFilter):
+    """
+    Filters blogs by category using the cached category list for its choices.
+    """
+    title = 'categories'
+    # Same parameter as the default related filter, so existing filter URLs keep working.
+    parameter_name = 'categories__id__exact'
+
+    def lookups(self, request, model_admin):
+        return [(category.pk, category.name) for category in get_cached_categories()]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(categories__id=self.value())
+        return queryset
 
 # Admin configuration for the ContactMessage model.
 class ContactMessageAdmin(admin.ModelAdmin):
     """
     Customizes the Django admin view for the ContactMessage model.
     """
-    list_display = ('name', 'email', 'message_preview', 'submitted_at')
+    list_display = ('name', 'email', 'preview', 'submitted_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_filter = ('submitted_at',)
-    search_fields = ('name', 'email', 'message')
+    # Only indexed columns; LIKE over the message body scans the whole table.
+    search_fields = ('name', 'email')
     readonly_fields = ('name', 'email', 'message', 'submitted_at')
     
-    def message_preview(self, obj):
-        return obj.message[:50] + '...' if len(obj.message) > 50 else obj.message
-    message_preview.short_description = 'Message Preview'
+    def get_queryset(self, request):
+        # The list shows the stored preview, so don't pull full message bodies.
+        return super().get_queryset(request).defer('message')
 
     def has_add_permission(self, request):
         return False
@@ -25,15 +62,23 @@ class CommentAdmin(admin.ModelAdmin):
     """
     Admin configuration for the Comment model.
     """
-    list_display = ('user', 'blog', 'content_preview', 'created_at', 'parent_comment')
+    list_display = ('user', 'blog', 'preview', 'created_at', 'parent_comment')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_filter = ('created_at', 'blog')
-    search_fields = ('user__username', 'blog__title', 'content')
+    # Only indexed columns; LIKE over the comment body scans the whole table.
+    search_fields = ('user__username', 'blog__title')
+    # parent_comment's __str__ reads its own user and blog, so join those too.
+    list_select_related = ('user', 'blog', 'parent_comment__user', 'parent_comment__blog')
     # Corrected field name back to 'updated_at' to match the likely model field.
     readonly_fields = ('created_at',)
     
-    def content_preview(self, obj):
-        return obj.content[:50] + '...' if len(obj.content) > 50 else obj.content
-    content_preview.short_description = 'Content Preview'
+    def get_queryset(self, request):
+        # The list shows the stored preview, so don't pull full comment bodies,
+        # nor the bodies of the joined blog posts and parent comments.
+        return super().get_queryset(request).defer(
+            'content', 'blog__content', 'parent_comment__content', 'parent_comment__blog__content'
+        )
 
 
 # Registering models with the Django admin site.
@@ -43,12 +88,15 @@ class ProfileAdmin(admin.ModelAdmin):
     Admin configuration for the Profile model.
     """
     list_display = ['user', 'user_type', 'email_verified', 'profile_picture_preview']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_filter = ['user_type', 'email_verified']
+    list_select_related = ['user']
     readonly_fields = ['verification_token', 'profile_picture_preview']
     
     def profile_picture_preview(self, obj):
         if obj.profile_picture:
-            return format_html('<img src="{}" width="50" height="50" style="object-fit: cover;" />', obj.profile_picture.url)
+            return format_html('<img src="{}" width="50" height="50" style="object-fit: cover;" />', _cached_file_url(obj.profile_picture))
         return "No Image"
     profile_picture_preview.short_description = 'Profile Picture'
 
@@ -59,11 +107,9 @@ class CategoryAdmin(admin.ModelAdmin):
     Admin configuration for the Category model.
     """
     list_display = ['name', 'blog_count']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     search_fields = ['name']
-    
-    def blog_count(self, obj):
-        return obj.blogs.count()
-    blog_count.short_description = 'Number of Blogs'
 
 
 @admin.register(Blog)
@@ -72,8 +118,12 @@ class BlogAdmin(admin.ModelAdmin):
     Admin configuration for the Blog model.
     """
     list_display = ['title', 'author', 'created_at', 'published', 'featured_image_preview', 'comment_count', 'average_rating']
-    list_filter = ['published', 'created_at', 'categories', 'author']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # Only list users who have written a post, not every account.
+    list_filter = ['published', 'created_at', CategoryListFilter, ('author', admin.RelatedOnlyFieldListFilter)]
     search_fields = ['title', 'content', 'author__username']
+    list_select_related = ['author']
     readonly_fields = ['created_at', 'updated_at', 'featured_image_preview']
     filter_horizontal = ['categories']
     fieldsets = (
@@ -92,20 +142,46 @@ class BlogAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        # The changelist never shows the post body, so leave it in the database.
+        return super().get_queryset(request).with_avg_rating().prefetch_related('categories').defer('content')
+    
+    def get_search_results(self, request, queryset, search_term):
+        # On PostgreSQL, match title/content against the trigger-maintained
+        # search_vector column (migration 0003) instead of LIKE over content.
+        # websearch_to_tsquery accepts the usual "phrase", OR and -term syntax.
+        if search_term and connection.vendor == 'postgresql':
+            tsquery = "websearch_to_tsquery('english', %s)"
+            matches = RawSQL(
+                f'blog_blog.search_vector @@ {tsquery}',
+                (search_term,),
+                output_field=BooleanField(),
+            )
+            rank = RawSQL(
+                f'ts_rank(blog_blog.search_vector, {tsquery})',
+                (search_term,),
+                output_field=FloatField(),
+            )
+            queryset = queryset.filter(
+                Q(matches) | Q(author__username__icontains=search_term)
+            ).annotate(search_rank=rank)
+            # Best matches first, unless a column sort was picked in the changelist.
+            if ORDER_VAR not in request.GET:
+                queryset = queryset.order_by('-search_rank', *queryset.query.order_by)
+            return queryset, False
+        return super().get_search_results(request, queryset, search_term)
+    
     def featured_image_preview(self, obj):
         if obj.featured_image:
-            return format_html('<img src="{}" width="100" height="60" style="object-fit: cover;" />', obj.featured_image.url)
+            return format_html('<img src="{}" width="100" height="60" style="object-fit: cover;" />', _cached_file_url(obj.featured_image))
         return "No Image"
     featured_image_preview.short_description = 'Featured Image Preview'
     
-    def comment_count(self, obj):
-        return obj.comments.count()
-    comment_count.short_description = 'Comments'
-    
     def average_rating(self, obj):
-        avg_rating = obj.average_rating
+        avg_rating = obj._avg_rating
         return f"{avg_rating:.1f}/5" if avg_rating else "No ratings"
     average_rating.short_description = 'Avg Rating'
+    average_rating.admin_order_field = '_avg_rating'
 
 
 @admin.register(Favorite)
@@ -114,8 +190,15 @@ class FavoriteAdmin(admin.ModelAdmin):
     Admin configuration for the Favorite model.
     """
     list_display = ['user', 'blog_title', 'created_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_filter = ['created_at']
     search_fields = ['user__username', 'blog__title']
+    list_select_related = ['user', 'blog']
+    
+    def get_queryset(self, request):
+        # Only the joined blog's title is shown, so skip its body.
+        return super().get_queryset(request).defer('blog__content')
     
     def blog_title(self, obj):
         return obj.blog.title
@@ -128,8 +211,15 @@ class RatingAdmin(admin.ModelAdmin):
     Admin configuration for the Rating model.
     """
     list_display = ['user', 'blog_title', 'score', 'created_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     list_filter = ['score', 'created_at']
     search_fields = ['user__username', 'blog__title']
+    list_select_related = ['user', 'blog']
+    
+    def get_queryset(self, request):
+        # Only the joined blog's title is shown, so skip its body.
+        return super().get_queryset(request).defer('blog__content')
     
     def blog_title(self, obj):
         return obj.blog.title
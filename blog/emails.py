@@ -0,0 +1,42 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from smtplib import SMTPException
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# A small pool keeps slow SMTP round-trips off the request thread.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='blog-mail')
+
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF = 2  # seconds, doubled after each failed attempt
+
+
+def _send_with_retry(subject, message, recipient_list):
+    """Sends the email, retrying transient SMTP/network failures with backoff."""
+    delay = RETRY_BACKOFF
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, recipient_list, fail_silently=False)
+            return
+        except (SMTPException, OSError):
+            if attempt == MAX_ATTEMPTS:
+                logger.exception('Failed to send "%s" to %s after %d attempts', subject, recipient_list, attempt)
+                return
+            logger.warning('Sending "%s" failed (attempt %d), retrying in %ss', subject, attempt, delay)
+            time.sleep(delay)
+            delay *= 2
+
+
+def send_mail_async(subject, message, recipient_list):
+    """
+    Queues an email to be sent in the background once the current
+    transaction commits, so the response never waits on the mail server.
+    The queue lives in process memory only: mail still waiting when the
+    worker exits or is restarted is lost.
+    """
+    transaction.on_commit(lambda: _executor.submit(_send_with_retry, subject, message, recipient_list))
@@ -7,7 +7,7 @@ from django import forms
 from django.contrib.auth.models import User
 from django.contrib.auth.forms import UserCreationForm
 # Added Comment model to imports
-from .models import Profile, Blog, Rating, Category, ContactMessage, Favorite, Comment
+from .models import Profile, Blog, Rating, Score, Category, ContactMessage, Favorite, Comment, get_cached_categories
 
 class UserRegisterForm(UserCreationForm):
     """
@@ -27,10 +27,10 @@ class UserRegisterForm(UserCreationForm):
     
     def clean_email(self):
         """
-        Custom validation to ensure the email is unique.
+        Custom validation to ensure the email is unique, ignoring case.
         """
         email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
+        if User.objects.filter(email__iexact=email).exclude(email='').exists():
             raise forms.ValidationError("This email address is already in use.")
         return email
 
@@ -42,6 +42,15 @@ class UserUpdateForm(forms.ModelForm):
         model = User
         fields = ['username', 'email', 'first_name', 'last_name'] # Corrected: added first_name and last_name to fix the CrispyError
 
+    def clean_email(self):
+        """
+        Ensures a changed email isn't already used by another account, ignoring case.
+        """
+        email = self.cleaned_data.get('email')
+        if email and User.objects.filter(email__iexact=email).exclude(email='').exclude(pk=self.instance.pk).exists():
+            raise forms.ValidationError("This email address is already in use.")
+        return email
+
 class ProfileUpdateForm(forms.ModelForm):
     """
     A form for users to update their profile information.
@@ -54,12 +63,36 @@ class ProfileUpdateForm(forms.ModelForm):
             'bio': forms.Textarea(attrs={'rows': 4}),
         }
 
+class CachedCategoryIterator(forms.models.ModelChoiceIterator):
+    """
+    Builds category choices from the cached category list, so rendering the
+    widget doesn't query the database on every request.
+    """
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for category in get_cached_categories():
+            yield self.choice(category)
+
+    def __len__(self):
+        return len(get_cached_categories()) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(get_cached_categories())
+
+class CategoryMultipleChoiceField(forms.ModelMultipleChoiceField):
+    """
+    Renders from the category cache; submitted values are still validated
+    against the queryset.
+    """
+    iterator = CachedCategoryIterator
+
 class BlogForm(forms.ModelForm):
     """
     A form for creating and updating blog posts.
     Uses CheckboxSelectMultiple for categories.
     """
-    categories = forms.ModelMultipleChoiceField(
+    categories = CategoryMultipleChoiceField(
         queryset=Category.objects.all(),
         widget=forms.CheckboxSelectMultiple,
         required=False
@@ -77,10 +110,8 @@ class RatingForm(forms.ModelForm):
     """
     A form for users to rate a blog post.
     """
-    RATING_CHOICES = [(i, i) for i in range(1, 6)]
-    
     score = forms.ChoiceField(
-        choices=RATING_CHOICES,
+        choices=Score.choices,
         widget=forms.RadioSelect,
         label='Rate this blog'
     )
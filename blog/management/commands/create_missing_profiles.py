@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import create_missing_profiles
+
+
+class Command(BaseCommand):
+    """
+    Creates Profiles for Users that don't have one, e.g. after a bulk import
+    done inside bulk_user_import() or with the profile signal disconnected.
+    """
+    help = 'Creates missing user profiles in a single bulk INSERT.'
+
+    def handle(self, *args, **options):
+        created = create_missing_profiles()
+        self.stdout.write(self.style.SUCCESS(f'Created {len(created)} profile(s).'))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import recount_blog_activity
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds Blog.like_count, dislike_count, favorite_count and comment_count
+    from the underlying rows, repairing any drift in the denormalized counters.
+    """
+    help = 'Recounts likes, dislikes, favorites and comments for every blog.'
+
+    def handle(self, *args, **options):
+        updated = recount_blog_activity()
+        self.stdout.write(self.style.SUCCESS(f'Recounted activity for {updated} blog(s).'))
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.5 on 2026-10-14 17:30
+
+from django.db import migrations, models
+
+
+# Trigram GIN indexes let PostgreSQL serve the admin's '%term%' searches
+# from an index. Other backends only get the plain b-tree indexes above.
+TRIGRAM_INDEXES = [
+    ('blog_blog_title_trgm', 'blog_blog', 'title'),
+    ('blog_category_name_trgm', 'blog_category', 'name'),
+    ('blog_contactmessage_name_trgm', 'blog_contactmessage', 'name'),
+    ('blog_contactmessage_email_trgm', 'blog_contactmessage', 'email'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='blog',
+            name='title',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='contactmessage',
+            name='email',
+            field=models.EmailField(db_index=True, max_length=254),
+        ),
+        migrations.AlterField(
+            model_name='contactmessage',
+            name='name',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
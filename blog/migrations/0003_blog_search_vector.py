@@ -0,0 +1,56 @@
+# Maintains a weighted full-text search vector for blog posts on PostgreSQL.
+#
+# The search_vector column is filled by a trigger and is not a model field,
+# so Django never reads or writes it. BlogAdmin.get_search_results matches it
+# with @@ on PostgreSQL and uses the regular search_fields lookup everywhere else.
+
+from django.db import migrations
+
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce({row}title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}content, '')), 'B')"
+)
+
+
+def create_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('ALTER TABLE blog_blog ADD COLUMN IF NOT EXISTS search_vector tsvector')
+    schema_editor.execute(f"""
+        CREATE OR REPLACE FUNCTION blog_blog_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    schema_editor.execute("""
+        CREATE TRIGGER blog_blog_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, content ON blog_blog
+        FOR EACH ROW EXECUTE PROCEDURE blog_blog_search_vector_update()
+    """)
+    schema_editor.execute(f"UPDATE blog_blog SET search_vector = {SEARCH_VECTOR_SQL.format(row='')}")
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS blog_blog_search_vector_gin ON blog_blog USING gin (search_vector)'
+    )
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP TRIGGER IF EXISTS blog_blog_search_vector_trigger ON blog_blog')
+    schema_editor.execute('DROP FUNCTION IF EXISTS blog_blog_search_vector_update()')
+    schema_editor.execute('DROP INDEX IF EXISTS blog_blog_search_vector_gin')
+    schema_editor.execute('ALTER TABLE blog_blog DROP COLUMN IF EXISTS search_vector')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_vector, drop_search_vector),
+    ]
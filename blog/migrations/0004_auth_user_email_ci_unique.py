@@ -0,0 +1,26 @@
+# Enforces case-insensitive unique emails on auth_user.
+#
+# Django creates no index on auth_user.email, so the forms' email__iexact
+# check compares UPPER(email) row by row. This expression index stops
+# differently-cased duplicates at the database. Blank emails, e.g. from
+# createsuperuser, are left out, so the index is partial: PostgreSQL only uses
+# it for UPPER(email::text) = UPPER(%s) when the query also excludes
+# email = '', which the forms do. SQLite compiles iexact to LIKE and never
+# uses the index; there it only enforces uniqueness.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('blog', '0003_blog_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE UNIQUE INDEX auth_user_email_ci_uniq ON auth_user (UPPER(email)) WHERE email <> ''",
+            reverse_sql='DROP INDEX auth_user_email_ci_uniq',
+        ),
+    ]
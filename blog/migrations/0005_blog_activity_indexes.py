@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-14 17:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_auth_user_email_ci_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dislike',
+            index=models.Index(fields=['blog', '-created_at'], name='blog_dislik_blog_id_00bec7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='favorite',
+            index=models.Index(fields=['blog', '-created_at'], name='blog_favori_blog_id_ab092b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='like',
+            index=models.Index(fields=['blog', '-created_at'], name='blog_like_blog_id_e0ed07_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(fields=['blog', 'score'], name='blog_rating_blog_id_7186d2_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-14 17:34
+
+import django.db.models.functions.text
+import django.db.models.lookups
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_blog_activity_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='preview',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(django.db.models.lookups.GreaterThan(django.db.models.functions.text.Length('content'), 50), then=django.db.models.functions.text.Concat(django.db.models.functions.text.Substr('content', 1, 50), models.Value('...'), output_field=models.TextField())), default=models.F('content'), output_field=models.TextField()), output_field=models.CharField(max_length=53), verbose_name='Content Preview'),
+        ),
+        migrations.AddField(
+            model_name='contactmessage',
+            name='preview',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(django.db.models.lookups.GreaterThan(django.db.models.functions.text.Length('message'), 50), then=django.db.models.functions.text.Concat(django.db.models.functions.text.Substr('message', 1, 50), models.Value('...'), output_field=models.TextField())), default=models.F('message'), output_field=models.TextField()), output_field=models.CharField(max_length=53), verbose_name='Message Preview'),
+        ),
+    ]
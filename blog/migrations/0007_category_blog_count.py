@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-14 17:36
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_blog_counts(apps, schema_editor):
+    Category = apps.get_model('blog', 'Category')
+    for category in Category.objects.annotate(total=Count('blogs')):
+        Category.objects.filter(pk=category.pk).update(blog_count=category.total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_stored_previews'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='blog_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, verbose_name='Number of Blogs'),
+        ),
+        migrations.RunPython(backfill_blog_counts, migrations.RunPython.noop),
+    ]
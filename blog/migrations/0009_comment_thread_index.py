@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-14 17:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_rating_score_choices'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['blog', 'parent_comment', '-created_at'], name='blog_commen_blog_id_ffd06e_idx'),
+        ),
+    ]
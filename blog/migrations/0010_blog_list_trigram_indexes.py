@@ -0,0 +1,46 @@
+# Trigram GIN indexes for the icontains search in blog_list.
+#
+# blog_list ORs icontains over title, content and the author's username.
+# PostgreSQL can answer those ILIKE '%q%' filters from pg_trgm indexes;
+# title already has one from 0002. The indexes are built CONCURRENTLY to
+# avoid locking the tables, which is why this migration is not atomic.
+# Other backends skip this migration's SQL.
+
+from django.db import migrations
+
+
+TRIGRAM_INDEXES = [
+    ('blog_blog_content_trgm', 'blog_blog', 'content'),
+    ('auth_user_username_trgm', 'auth_user', 'username'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('blog', '0009_comment_thread_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
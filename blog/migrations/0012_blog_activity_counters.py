@@ -0,0 +1,51 @@
+# Generated by Django 5.2.5 on 2026-10-14 17:50
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_activity_counts(apps, schema_editor):
+    Blog = apps.get_model('blog', 'Blog')
+    updates = {}
+    for field, model_name in [
+        ('like_count', 'Like'),
+        ('dislike_count', 'Dislike'),
+        ('favorite_count', 'Favorite'),
+        ('comment_count', 'Comment'),
+    ]:
+        model = apps.get_model('blog', model_name)
+        per_blog = model.objects.filter(blog=OuterRef('pk')).order_by().values('blog').annotate(n=Count('pk')).values('n')
+        updates[field] = Coalesce(Subquery(per_blog), 0)
+    Blog.objects.update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blog',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Comments'),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='dislike_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Dislikes'),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='favorite_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Favorites'),
+        ),
+        migrations.AddField(
+            model_name='blog',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Likes'),
+        ),
+        migrations.RunPython(backfill_activity_counts, migrations.RunPython.noop),
+    ]
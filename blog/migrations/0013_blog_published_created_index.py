@@ -0,0 +1,54 @@
+# Partial index for the published, newest-first blog listing.
+#
+# blog_list only ever seeks over published posts, so the (created_at, id)
+# index from 0011 is replaced by one restricted to published=True. On
+# PostgreSQL both indexes are built and dropped CONCURRENTLY to avoid
+# locking blog_blog, which is why this migration is not atomic. The
+# comment thread index this pairs with already exists from 0009.
+
+from django.db import migrations, models
+
+
+OLD_INDEX = models.Index(fields=['-created_at', '-id'], name='blog_blog_created_2793a1_idx')
+NEW_INDEX = models.Index(
+    fields=['-created_at', '-id'],
+    condition=models.Q(published=True),
+    name='blog_published_created_idx',
+)
+
+
+def _concurrently(schema_editor):
+    return {'concurrently': True} if schema_editor.connection.vendor == 'postgresql' else {}
+
+
+def swap_indexes(apps, schema_editor):
+    Blog = apps.get_model('blog', 'Blog')
+    schema_editor.add_index(Blog, NEW_INDEX, **_concurrently(schema_editor))
+    schema_editor.remove_index(Blog, OLD_INDEX, **_concurrently(schema_editor))
+
+
+def restore_indexes(apps, schema_editor):
+    Blog = apps.get_model('blog', 'Blog')
+    schema_editor.add_index(Blog, OLD_INDEX, **_concurrently(schema_editor))
+    schema_editor.remove_index(Blog, NEW_INDEX, **_concurrently(schema_editor))
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('blog', '0012_blog_activity_counters'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(swap_indexes, restore_indexes),
+            ],
+            state_operations=[
+                migrations.RemoveIndex(model_name='blog', name='blog_blog_created_2793a1_idx'),
+                migrations.AddIndex(model_name='blog', index=NEW_INDEX),
+            ],
+        ),
+    ]
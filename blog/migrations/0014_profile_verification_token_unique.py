@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-14 17:55
+
+import uuid
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def regenerate_duplicate_tokens(apps, schema_editor):
+    # Rows added alongside a one-off default could share a token; give each
+    # of them a fresh one before the unique index goes on.
+    Profile = apps.get_model('blog', 'Profile')
+    duplicated = Profile.objects.values('verification_token').annotate(n=Count('pk')).filter(n__gt=1)
+    for row in duplicated:
+        for profile in Profile.objects.filter(verification_token=row['verification_token']):
+            Profile.objects.filter(pk=profile.pk).update(verification_token=uuid.uuid4())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_blog_published_created_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(regenerate_duplicate_tokens, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='profile',
+            name='verification_token',
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
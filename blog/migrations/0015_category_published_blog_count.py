@@ -0,0 +1,23 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_published_blogs(apps, schema_editor):
+    Blog = apps.get_model('blog', 'Blog')
+    Category = apps.get_model('blog', 'Category')
+    published_per_category = Blog.categories.through.objects.filter(
+        category_id=OuterRef('pk'), blog__published=True
+    ).order_by().values('category_id').annotate(total=Count('*')).values('total')
+    Category.objects.update(blog_count=Coalesce(Subquery(published_per_category), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_profile_verification_token_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(count_published_blogs, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,14 @@
 # blog_app/models.py
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from contextlib import contextmanager
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
 from django.dispatch import receiver
-from django.db.models import Avg
+from django.utils.functional import cached_property
+from django.db.models import Avg, Count, Case, Exists, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Concat, Greatest, Length, Substr
+from django.db.models.lookups import GreaterThan
 import uuid
 
 # User Profile Model
@@ -26,22 +31,62 @@ class Profile(models.Model):
     )
     social_media = models.URLField(blank=True, null=True)
     email_verified = models.BooleanField(default=False)
-    verification_token = models.UUIDField(default=uuid.uuid4, editable=False)
+    verification_token = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
 # Signal to create a Profile for new Users
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
     """Creates a Profile instance whenever a new User is created."""
-    if created:
-        Profile.objects.create(user=instance)
+    # Fixture loads (raw saves) bring their own Profile rows, so leave them be;
+    # get_or_create keeps replayed saves from raising IntegrityError.
+    if created and not raw:
+        Profile.objects.get_or_create(user=instance)
+
+def create_missing_profiles():
+    """Creates Profiles for every User that lacks one, in a single INSERT."""
+    users = User.objects.filter(profile__isnull=True).only('pk')
+    return Profile.objects.bulk_create([Profile(user=user) for user in users], ignore_conflicts=True)
+
+@contextmanager
+def bulk_user_import():
+    """
+    Disables the per-user Profile signal while importing Users in bulk, then
+    creates the missing Profiles with one bulk INSERT when the block succeeds.
+    """
+    post_save.disconnect(create_user_profile, sender=User)
+    try:
+        yield
+    finally:
+        post_save.connect(create_user_profile, sender=User)
+    create_missing_profiles()
+
+class CounterFieldsMixin:
+    """
+    Keeps signal-maintained counter columns out of ordinary saves. Those
+    columns are moved by F() UPDATEs behind the instance's back, so a full-row
+    save of a loaded instance would write its stale values over them.
+    """
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
 
 # Category Model
-class Category(models.Model):
+class Category(CounterFieldsMixin, models.Model):
     """Represents a category for blog posts."""
+    counter_fields = ('blog_count',)
+
     name = models.CharField(max_length=100, unique=True)
+    # Denormalized number of published blogs in the category, kept current by the signals below Blog.
+    blog_count = models.PositiveIntegerField(default=0, db_index=True, editable=False, verbose_name='Number of Blogs')
     
     def __str__(self):
         return self.name
@@ -50,10 +95,52 @@ class Category(models.Model):
         verbose_name_plural = "Categories"
         ordering = ['name']
 
+# Cache keys for the sidebar lists; the signals further down clear them on change.
+CATEGORIES_CACHE_KEY = 'categories_v1'
+RECENT_BLOGS_CACHE_KEY = 'recent_blogs_v1'
+AUTHORS_CACHE_KEY = 'authors_v1'
+SIDEBAR_CACHE_TIMEOUT = 60
+
+def get_cached_categories():
+    """Returns all categories, cached for a minute since the list rarely changes."""
+    return cache.get_or_set(CATEGORIES_CACHE_KEY, lambda: list(Category.objects.all()), SIDEBAR_CACHE_TIMEOUT)
+
+# Enough leading characters of a post for the ~30-word teaser on list pages.
+EXCERPT_LENGTH = 500
+
+class BlogQuerySet(models.QuerySet):
+    """Queryset for Blog with helpers that push per-blog aggregates into SQL."""
+
+    def with_avg_rating(self):
+        """Annotates each blog with its average rating and number of ratings."""
+        return self.annotate(
+            _avg_rating=Avg('blog_ratings__score'),
+            rating_count=Count('blog_ratings', distinct=True),
+        )
+
+    def for_listing(self):
+        """
+        Skips loading the full content column, annotating a short `excerpt`
+        for list templates instead.
+        """
+        return self.defer('content').annotate(excerpt=Substr('content', 1, EXCERPT_LENGTH))
+
+    def with_user_reactions(self, user):
+        """Annotates whether `user` has favorited, liked or disliked each blog."""
+        if not user.is_authenticated:
+            return self.annotate(is_favorited=Value(False), user_liked=Value(False), user_disliked=Value(False))
+        return self.annotate(
+            is_favorited=Exists(Favorite.objects.filter(user=user, blog=OuterRef('pk'))),
+            user_liked=Exists(Like.objects.filter(user=user, blog=OuterRef('pk'))),
+            user_disliked=Exists(Dislike.objects.filter(user=user, blog=OuterRef('pk'))),
+        )
+
 # Blog Post Model
-class Blog(models.Model):
+class Blog(CounterFieldsMixin, models.Model):
     """Represents a single blog post."""
-    title = models.CharField(max_length=200)
+    counter_fields = ('like_count', 'dislike_count', 'favorite_count', 'comment_count')
+
+    title = models.CharField(max_length=200, db_index=True)
     content = models.TextField()
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='blog_posts')
     categories = models.ManyToManyField(Category, related_name='blogs')
@@ -62,40 +149,159 @@ class Blog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published = models.BooleanField(default=False)
+    # Activity counters, kept in sync by the signals at the bottom of this module.
+    like_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='Likes')
+    dislike_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='Dislikes')
+    favorite_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='Favorites')
+    comment_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='Comments')
+
+    objects = BlogQuerySet.as_manager()
     
     def __str__(self):
         return self.title
     
-    @property
+    @cached_property
     def average_rating(self):
-        """Calculates the average rating for the blog post using database aggregation."""
-        ratings = self.blog_ratings.aggregate(Avg('score'))
-        return round(ratings['score__avg'], 1) if ratings['score__avg'] else 0
+        """
+        Returns the average rating for the blog post. Uses the with_avg_rating()
+        annotation when present and falls back to a database aggregation otherwise.
+        Cached on the instance, so repeated template reads run the fallback once.
+        """
+        if hasattr(self, '_avg_rating'):
+            avg_rating = self._avg_rating
+        else:
+            avg_rating = self.blog_ratings.aggregate(Avg('score'))['score__avg']
+        return round(avg_rating, 1) if avg_rating else 0
 
     class Meta:
         ordering = ['-created_at']
+        # Backs blog_list's published-only (created_at, id) seek in CursorPaginator;
+        # the partial index leaves drafts out entirely.
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], condition=Q(published=True), name='blog_published_created_idx'),
+        ]
 
+def refresh_category_blog_counts(category_ids):
+    """Recomputes Category.blog_count from published blogs for the given categories in a single UPDATE."""
+    blogs_per_category = Blog.categories.through.objects.filter(
+        category_id=OuterRef('pk'), blog__published=True
+    ).order_by().values('category_id').annotate(total=Count('*')).values('total')
+    Category.objects.filter(pk__in=category_ids).update(
+        blog_count=Coalesce(Subquery(blogs_per_category), 0)
+    )
+    cache.delete(CATEGORIES_CACHE_KEY)
+
+# Signals to keep Category.blog_count in sync with Blog.categories
+@receiver(m2m_changed, sender=Blog.categories.through)
+def update_category_blog_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refreshes category counts after blogs are added to or removed from categories."""
+    if reverse:
+        # Called from the category side (category.blogs.add(...)).
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            refresh_category_blog_counts([instance.pk])
+        return
+    if action == 'pre_clear':
+        # pk_set is None on clear, so remember the categories before they go.
+        instance._cleared_category_ids = list(instance.categories.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        refresh_category_blog_counts(getattr(instance, '_cleared_category_ids', []))
+    elif action in ('post_add', 'post_remove'):
+        refresh_category_blog_counts(pk_set)
+
+@receiver(post_save, sender=Blog)
+def update_published_blog_category_counts(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Publishing or unpublishing a blog changes which categories count it."""
+    if created or raw or (update_fields is not None and 'published' not in update_fields):
+        return
+    refresh_category_blog_counts(list(instance.categories.values_list('pk', flat=True)))
 
+@receiver(pre_delete, sender=Blog)
+def remember_blog_categories(sender, instance, **kwargs):
+    """Deleting a blog drops its category links without sending m2m_changed."""
+    instance._deleted_category_ids = list(instance.categories.values_list('pk', flat=True))
 
-class Like(models.Model):
+@receiver(post_delete, sender=Blog)
+def update_deleted_blog_category_counts(sender, instance, **kwargs):
+    refresh_category_blog_counts(getattr(instance, '_deleted_category_ids', []))
+
+def get_recent_blogs():
+    """Returns the five newest published blogs for the sidebars, cached for a minute."""
+    return cache.get_or_set(
+        RECENT_BLOGS_CACHE_KEY,
+        lambda: list(Blog.objects.filter(published=True).only('id', 'title', 'created_at').order_by('-created_at')[:5]),
+        SIDEBAR_CACHE_TIMEOUT,
+    )
+
+def get_sidebar_authors():
+    """Returns authors with their published post counts, most prolific first, cached for a minute."""
+    return cache.get_or_set(
+        AUTHORS_CACHE_KEY,
+        lambda: list(User.objects.filter(profile__user_type='author').only(
+            'id', 'username', 'first_name', 'last_name',
+        ).annotate(
+            blog_count=Count('blog_posts', filter=Q(blog_posts__published=True))
+        ).order_by('-blog_count', 'username')),
+        SIDEBAR_CACHE_TIMEOUT,
+    )
+
+# Signals to clear the sidebar caches when their source rows change
+@receiver([post_save, post_delete], sender=Blog)
+def clear_blog_sidebar_cache(sender, **kwargs):
+    cache.delete_many([RECENT_BLOGS_CACHE_KEY, AUTHORS_CACHE_KEY])
+
+@receiver([post_save, post_delete], sender=Category)
+def clear_category_cache(sender, **kwargs):
+    cache.delete(CATEGORIES_CACHE_KEY)
+
+@receiver([post_save, post_delete], sender=Profile)
+def clear_author_cache(sender, **kwargs):
+    # A changed user_type can add or remove someone from the authors list.
+    cache.delete(AUTHORS_CACHE_KEY)
+
+
+
+class UserBlogToggleMixin:
+    """Adds toggle() to models that are unique on (user, blog)."""
+
+    @classmethod
+    def toggle(cls, user, blog):
+        """
+        Removes the user's row for the blog if there is one, otherwise adds it.
+        The insert goes through save() so the Blog counters see it; if a
+        concurrent toggle inserts first, the IntegrityError is swallowed.
+        Returns True if the row was added.
+        """
+        deleted, _ = cls.objects.filter(user=user, blog=blog).delete()
+        if deleted:
+            return False
+        try:
+            with transaction.atomic():
+                cls.objects.create(user=user, blog=blog)
+        except IntegrityError:
+            pass
+        return True
+
+class Like(UserBlogToggleMixin, models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     blog = models.ForeignKey(Blog, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         unique_together = ('user', 'blog')
+        indexes = [models.Index(fields=['blog', '-created_at'])]
 
-class Dislike(models.Model):
+class Dislike(UserBlogToggleMixin, models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     blog = models.ForeignKey(Blog, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         unique_together = ('user', 'blog')
+        indexes = [models.Index(fields=['blog', '-created_at'])]
 
 
 # Favorite Model
-class Favorite(models.Model):
+class Favorite(UserBlogToggleMixin, models.Model):
     """Allows a user to favorite a blog post."""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='favorites')
     blog = models.ForeignKey(Blog, on_delete=models.CASCADE, related_name='favorited_by')
@@ -104,32 +310,66 @@ class Favorite(models.Model):
     class Meta:
         unique_together = ('user', 'blog')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['blog', '-created_at']),
+            # Backs the per-user (created_at, id) seek in favorite_list.
+            models.Index(fields=['user', '-created_at', '-id']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} favorited {self.blog.title}"
 
+class Score(models.IntegerChoices):
+    """The allowed rating values, shared by Rating and RatingForm."""
+    ONE = 1, '1'
+    TWO = 2, '2'
+    THREE = 3, '3'
+    FOUR = 4, '4'
+    FIVE = 5, '5'
+
 # Rating Model
 class Rating(models.Model):
     """Allows a user to rate a blog post."""
-    RATING_CHOICES = [(i, i) for i in range(1, 6)]
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     blog = models.ForeignKey(Blog, on_delete=models.CASCADE, related_name='blog_ratings')
-    score = models.IntegerField(choices=RATING_CHOICES)
+    score = models.IntegerField(choices=Score.choices)
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
         unique_together = ('user', 'blog')
+        # Covers the per-blog Avg('score') behind Blog.average_rating.
+        indexes = [models.Index(fields=['blog', 'score'])]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(score__in=Score.values), name='rating_score_valid'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} rated {self.blog.title} as {self.score}"
 
+def preview_expression(field_name, length=50):
+    """Builds the SQL for the first `length` characters of a field, with '...' if it was cut."""
+    return Case(
+        When(
+            GreaterThan(Length(field_name), length),
+            then=Concat(Substr(field_name, 1, length), Value('...'), output_field=models.TextField()),
+        ),
+        default=F(field_name),
+        output_field=models.TextField(),
+    )
+
 # Contact Message Model
 class ContactMessage(models.Model):
     """Stores messages submitted via the contact form."""
-    name = models.CharField(max_length=100)
-    email = models.EmailField()
+    name = models.CharField(max_length=100, db_index=True)
+    email = models.EmailField(db_index=True)
     message = models.TextField()
     submitted_at = models.DateTimeField(auto_now_add=True)
+    preview = models.GeneratedField(
+        expression=preview_expression('message'),
+        output_field=models.CharField(max_length=53),
+        db_persist=True,
+        verbose_name='Message Preview',
+    )
 
     def __str__(self):
         return f"Message from {self.name} on {self.submitted_at.strftime('%Y-%m-%d')}"
@@ -156,6 +396,12 @@ class Comment(models.Model):
     )
     content = models.TextField(verbose_name='Comment Content')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='Posted At')
+    preview = models.GeneratedField(
+        expression=preview_expression('content'),
+        output_field=models.CharField(max_length=53),
+        db_persist=True,
+        verbose_name='Content Preview',
+    )
     parent_comment = models.ForeignKey(
         'self',
         on_delete=models.CASCADE,
@@ -169,10 +415,51 @@ class Comment(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Comment'
         verbose_name_plural = 'Comments'
+        # Serves "top-level comments of this blog, newest first" without a sort.
+        indexes = [models.Index(fields=['blog', 'parent_comment', '-created_at'])]
 
     def __str__(self):
         return f'Comment by {self.user.username} on {self.blog.title[:30]}'
 
     def get_replies(self):
-        """Returns all replies to this comment."""
-        return self.replies.all()
+        """Returns all replies to this comment, with their authors loaded."""
+        return self.replies.select_related('user__profile')
+
+# Signals to keep the Blog activity counters in sync
+BLOG_COUNTER_FIELDS = {
+    Like: 'like_count',
+    Dislike: 'dislike_count',
+    Favorite: 'favorite_count',
+    Comment: 'comment_count',
+}
+
+def recount_blog_activity():
+    """
+    Rebuilds every Blog activity counter from the related rows in one UPDATE
+    and returns the number of blogs updated.
+    """
+    updates = {}
+    for model, field in BLOG_COUNTER_FIELDS.items():
+        per_blog = model.objects.filter(blog=OuterRef('pk')).order_by().values('blog').annotate(n=Count('pk')).values('n')
+        updates[field] = Coalesce(Subquery(per_blog), 0)
+    return Blog.objects.update(**updates)
+
+def adjust_blog_counter(sender, blog_id, delta):
+    """Shifts one Blog counter in place with an F() update, never below zero."""
+    field = BLOG_COUNTER_FIELDS[sender]
+    Blog.objects.filter(pk=blog_id).update(**{field: Greatest(F(field) + delta, 0)})
+
+@receiver(post_save, sender=Like)
+@receiver(post_save, sender=Dislike)
+@receiver(post_save, sender=Favorite)
+@receiver(post_save, sender=Comment)
+def increment_blog_counter(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        adjust_blog_counter(sender, instance.blog_id, 1)
+
+@receiver(post_delete, sender=Like)
+@receiver(post_delete, sender=Dislike)
+@receiver(post_delete, sender=Favorite)
+@receiver(post_delete, sender=Comment)
+def decrement_blog_counter(sender, instance, **kwargs):
+    adjust_blog_counter(sender, instance.blog_id, -1)
@@ -0,0 +1,169 @@
+import base64
+import binascii
+import hashlib
+from collections.abc import Sequence
+from datetime import datetime
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    A paginator that skips SELECT COUNT(*) on large unfiltered PostgreSQL tables.
+    The count comes from the planner's row estimate (pg_class.reltuples)
+    instead. Filtered querysets, small tables and other databases still get
+    an exact count.
+    """
+    # Below this many rows COUNT(*) is cheap and the estimate is least reliable.
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        estimate = self.estimated_count()
+        if estimate is None or estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
+
+    def estimated_count(self, queryset=None):
+        """Returns the planner's row estimate for an unfiltered queryset, or None."""
+        if queryset is None:
+            queryset = self.object_list
+        if not isinstance(queryset, QuerySet) or queryset.query.where:
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 for tables that have never been analyzed.
+        return row[0] if row and row[0] >= 0 else None
+
+
+class CachedCountPaginator(EstimatedCountPaginator):
+    """
+    A paginator for public list pages whose COUNT(*) is shared between requests.
+    Unfiltered PostgreSQL tables still use the planner estimate; any other
+    queryset's exact count is cached for a short time, keyed by its SQL.
+    Pass count_queryset to count (and key) a leaner queryset than the one
+    listed, e.g. one without per-viewer annotations, so the entry is shared.
+    """
+    count_cache_timeout = 30
+
+    def __init__(self, object_list, per_page, *args, count_queryset=None, **kwargs):
+        super().__init__(object_list, per_page, *args, **kwargs)
+        self.count_queryset = object_list if count_queryset is None else count_queryset
+
+    @cached_property
+    def count(self):
+        queryset = self.count_queryset
+        estimate = self.estimated_count(queryset)
+        if estimate is not None and estimate >= self.exact_count_threshold:
+            return estimate
+        if not isinstance(queryset, QuerySet):
+            return len(queryset)
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.md5(repr((queryset.db, sql, params)).encode()).hexdigest()
+        return cache.get_or_set(f'paginator_count:{digest}', queryset.count, self.count_cache_timeout)
+
+
+class CursorPage(Sequence):
+    """
+    One page of a CursorPaginator. Exposes the cursors for the neighbouring
+    pages, since there are no page numbers to link to.
+    """
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __repr__(self):
+        return '<CursorPage of %d items>' % len(self)
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous and bool(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        return self.paginator.encode_cursor('n', self.object_list[-1]) if self.has_next() else None
+
+    @property
+    def previous_cursor(self):
+        return self.paginator.encode_cursor('p', self.object_list[0]) if self.has_previous() else None
+
+
+class CursorPaginator:
+    """
+    Keyset paginator for querysets listed newest first.
+    Instead of LIMIT/OFFSET, each page seeks past the (created_at, pk) of the
+    last row it was given, so deep pages cost the same as the first and no
+    COUNT(*) is needed. The cursor is an opaque token carried in the URL.
+    """
+    ordering_field = 'created_at'
+
+    def __init__(self, object_list, per_page):
+        self.object_list = object_list
+        self.per_page = per_page
+
+    def encode_cursor(self, direction, obj):
+        value = f'{direction}|{getattr(obj, self.ordering_field).isoformat()}|{obj.pk}'
+        return base64.urlsafe_b64encode(value.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Returns (direction, value, pk) for a cursor, or None if it is missing or malformed."""
+        if not cursor:
+            return None
+        try:
+            value = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+            direction, timestamp, pk = value.split('|')
+            if direction not in ('n', 'p'):
+                return None
+            return direction, datetime.fromisoformat(timestamp), int(pk)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
+
+    def page(self, cursor):
+        """Returns the page after (or before) the cursor; the first page if there is none."""
+        field = self.ordering_field
+        position = self.decode_cursor(cursor)
+        if position is None:
+            rows = list(self.object_list.order_by(f'-{field}', '-pk')[:self.per_page + 1])
+            return CursorPage(rows[:self.per_page], self, has_next=len(rows) > self.per_page, has_previous=False)
+
+        direction, value, pk = position
+        if direction == 'n':
+            queryset = self.object_list.filter(
+                Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk})
+            ).order_by(f'-{field}', '-pk')
+            rows = list(queryset[:self.per_page + 1])
+            return CursorPage(rows[:self.per_page], self, has_next=len(rows) > self.per_page, has_previous=True)
+
+        # Walk backwards from the cursor, then restore newest-first order.
+        queryset = self.object_list.filter(
+            Q(**{f'{field}__gt': value}) | Q(**{field: value, 'pk__gt': pk})
+        ).order_by(field, 'pk')
+        rows = list(queryset[:self.per_page + 1])
+        if not rows:
+            return self.page(None)
+        return CursorPage(rows[:self.per_page][::-1], self, has_next=True, has_previous=len(rows) > self.per_page)
@@ -1,3 +1,295 @@
+import base64
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import authenticate
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+from django.core import serializers
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+
+from .forms import BlogForm, UserUpdateForm
+from .models import Blog, Category, Comment, Dislike, Favorite, Like, Profile
+from .paginators import CachedCountPaginator, CursorPaginator
+
+
+class ProfileSignalTests(TestCase):
+    def test_fixture_with_users_and_profiles_loads(self):
+        user = User.objects.create_user('author', 'author@example.com', 'pw')
+        user.profile.user_type = 'author'
+        user.profile.save()
+        data = serializers.serialize('json', [user, user.profile])
+        user.delete()
+
+        # DeserializedObject.save() is a raw save, as in loaddata.
+        for obj in serializers.deserialize('json', data):
+            obj.save()
+
+        profile = Profile.objects.get(user__username='author')
+        self.assertEqual(profile.user_type, 'author')
+
+
+class CategoryCounterSaveTests(TestCase):
+    def test_saving_a_stale_instance_keeps_blog_count(self):
+        category = Category.objects.create(name='Django')
+        stale = Category.objects.get(pk=category.pk)
+        Category.objects.filter(pk=category.pk).update(blog_count=3)
+
+        stale.name = 'Django ORM'
+        stale.save()
+
+        category.refresh_from_db()
+        self.assertEqual(category.name, 'Django ORM')
+        self.assertEqual(category.blog_count, 3)
+
+
+class CategoryBlogCountSignalTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user('author', 'author@example.com', 'pw')
+        self.news = Category.objects.create(name='News')
+        self.tech = Category.objects.create(name='Tech')
+        self.first = Blog.objects.create(title='First', content='Body', author=self.author, published=True)
+        self.second = Blog.objects.create(title='Second', content='Body', author=self.author, published=True)
+
+    def counts(self):
+        return tuple(Category.objects.filter(pk__in=[self.news.pk, self.tech.pk]).order_by('name').values_list('blog_count', flat=True))
+
+    def test_add_remove_set_and_clear_from_the_blog_side(self):
+        self.first.categories.add(self.news, self.tech)
+        self.second.categories.add(self.news)
+        self.assertEqual(self.counts(), (2, 1))
+
+        self.first.categories.remove(self.tech)
+        self.assertEqual(self.counts(), (2, 0))
+
+        self.first.categories.set([self.tech])
+        self.assertEqual(self.counts(), (1, 1))
+
+        self.first.categories.clear()
+        self.assertEqual(self.counts(), (1, 0))
+
+    def test_add_remove_set_and_clear_from_the_category_side(self):
+        self.news.blogs.add(self.first, self.second)
+        self.tech.blogs.add(self.first)
+        self.assertEqual(self.counts(), (2, 1))
+
+        self.news.blogs.remove(self.first)
+        self.assertEqual(self.counts(), (1, 1))
+
+        self.tech.blogs.set([self.second])
+        self.assertEqual(self.counts(), (1, 1))
+        self.assertEqual(list(self.tech.blogs.all()), [self.second])
+
+        self.news.blogs.clear()
+        self.assertEqual(self.counts(), (0, 1))
+
+    def test_drafts_are_not_counted_until_published(self):
+        draft = Blog.objects.create(title='Draft', content='Body', author=self.author, published=False)
+        draft.categories.add(self.news)
+        self.assertEqual(self.counts(), (0, 0))
+
+        draft.published = True
+        draft.save()
+        self.assertEqual(self.counts(), (1, 0))
+
+        draft.published = False
+        draft.save(update_fields=['published', 'updated_at'])
+        self.assertEqual(self.counts(), (0, 0))
+
+    def test_deleting_a_blog_or_its_author_uncounts_it(self):
+        self.first.categories.add(self.news, self.tech)
+        self.second.categories.add(self.news)
+
+        self.second.delete()
+        self.assertEqual(self.counts(), (1, 1))
+
+        self.author.delete()
+        self.assertEqual(self.counts(), (0, 0))
+
+
+class BlogCounterSaveTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user('author', 'author@example.com', 'pw')
+        self.reader = User.objects.create_user('reader', 'reader@example.com', 'pw')
+        self.category = Category.objects.create(name='News')
+        self.blog = Blog.objects.create(title='Post', content='Body', author=self.author, published=True)
+        Like.toggle(self.author, self.blog)
+
+    def test_saving_a_stale_instance_keeps_like_count(self):
+        stale = Blog.objects.get(pk=self.blog.pk)
+        # Another user's like lands after the edit form loaded the blog.
+        Like.toggle(self.reader, self.blog)
+
+        form = BlogForm(
+            {'title': 'Edited', 'content': 'New body', 'categories': [self.category.pk], 'published': 'on'},
+            instance=stale,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+
+        self.blog.refresh_from_db()
+        self.assertEqual(self.blog.title, 'Edited')
+        self.assertEqual(self.blog.like_count, 2)
+
+    def test_recount_command_repairs_drifted_counts(self):
+        Blog.objects.filter(pk=self.blog.pk).update(like_count=7, comment_count=3)
+
+        call_command('recount_blog_activity', stdout=StringIO())
+
+        self.blog.refresh_from_db()
+        self.assertEqual((self.blog.like_count, self.blog.comment_count), (1, 0))
+
+
+class BlogCounterSignalTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create_user('author', 'author@example.com', 'pw')
+        self.reader = User.objects.create_user('reader', 'reader@example.com', 'pw')
+        self.blog = Blog.objects.create(title='Post', content='Body', author=self.author, published=True)
+
+    def counts(self):
+        self.blog.refresh_from_db()
+        return (self.blog.like_count, self.blog.dislike_count, self.blog.favorite_count, self.blog.comment_count)
+
+    def react(self, reaction):
+        return self.client.post(
+            f'/blog/{self.blog.pk}/like-dislike/', json.dumps({'reaction': reaction}), content_type='application/json'
+        )
+
+    def test_toggle_adds_then_removes(self):
+        self.assertTrue(Favorite.toggle(self.reader, self.blog))
+        self.assertTrue(Like.toggle(self.author, self.blog))
+        self.assertEqual(self.counts(), (1, 0, 1, 0))
+
+        self.assertFalse(Favorite.toggle(self.reader, self.blog))
+        self.assertFalse(Like.toggle(self.author, self.blog))
+        self.assertEqual(self.counts(), (0, 0, 0, 0))
+
+    def test_reaction_replaces_the_opposite_one(self):
+        self.client.force_login(self.reader)
+
+        self.react('like')
+        self.assertEqual(self.counts(), (1, 0, 0, 0))
+        self.react('dislike')
+        self.assertEqual(self.counts(), (0, 1, 0, 0))
+        self.assertFalse(Like.objects.filter(user=self.reader, blog=self.blog).exists())
+        self.react('like')
+        self.assertEqual(self.counts(), (1, 0, 0, 0))
+        self.assertFalse(Dislike.objects.filter(user=self.reader, blog=self.blog).exists())
+        self.react('like')
+        self.assertEqual(self.counts(), (0, 0, 0, 0))
+
+    def test_deleting_a_comment_also_uncounts_its_replies(self):
+        parent = Comment.objects.create(blog=self.blog, user=self.reader, content='First')
+        Comment.objects.create(blog=self.blog, user=self.author, content='Reply', parent_comment=parent)
+        Comment.objects.create(blog=self.blog, user=self.author, content='Other')
+        self.assertEqual(self.counts()[3], 3)
+
+        parent.delete()
+        self.assertEqual(self.counts()[3], 1)
+
+
+class EmailUniquenessFormTests(TestCase):
+    def test_update_rejects_another_users_email_in_any_case(self):
+        User.objects.create_user('first', 'Taken@Example.com', 'pw')
+        user = User.objects.create_user('second', 'second@example.com', 'pw')
+        form = UserUpdateForm({'username': 'second', 'email': 'taken@example.COM'}, instance=user)
+        self.assertFalse(form.is_valid())
+        self.assertIn('email', form.errors)
+
+
+class AuthenticationBackendTests(TestCase):
+    def test_failed_login_tries_a_single_backend(self):
+        User.objects.create_user('reader', 'reader@example.com', 'pw')
+        with mock.patch.object(ModelBackend, 'authenticate', autospec=True, side_effect=ModelBackend.authenticate) as backend:
+            self.assertIsNone(authenticate(username='reader', password='wrong'))
+        self.assertEqual(backend.call_count, 1)
+
+    def test_session_user_comes_with_profile(self):
+        user = User.objects.create_user('reader', 'reader@example.com', 'pw')
+        self.client.force_login(user)
+        request_user = self.client.get('/').wsgi_request.user
+        # Session row, then the user joined with their profile.
+        with self.assertNumQueries(2):
+            request_user.pk
+        with self.assertNumQueries(0):
+            self.assertEqual(request_user.profile.user_id, user.pk)
+
+
+class CachedCountPaginatorTests(TestCase):
+    def test_count_is_shared_between_viewers(self):
+        author = User.objects.create_user('author', 'author@example.com', 'pw')
+        reader = User.objects.create_user('reader', 'reader@example.com', 'pw')
+        Blog.objects.create(title='Post', content='Body', author=author, published=True)
+        published = Blog.objects.filter(published=True)
+        cache.clear()
+
+        first = CachedCountPaginator(published.with_user_reactions(author), 10, count_queryset=published)
+        self.assertEqual(first.count, 1)
+        second = CachedCountPaginator(published.with_user_reactions(reader), 10, count_queryset=published)
+        with self.assertNumQueries(0):
+            self.assertEqual(second.count, 1)
+
+
+class CursorPaginatorTests(TestCase):
+    def setUp(self):
+        author = User.objects.create_user('author', 'author@example.com', 'pw')
+        now = timezone.now()
+        # Three posts share a timestamp so the pk tie-breaker is exercised
+        # across a page boundary.
+        offsets = [0, 1, 2, 2, 2, 3, 4]
+        for index, offset in enumerate(offsets):
+            blog = Blog.objects.create(title=f'Post {index}', content='Body', author=author, published=True)
+            Blog.objects.filter(pk=blog.pk).update(created_at=now - timedelta(hours=offset))
+        self.expected = list(Blog.objects.order_by('-created_at', '-pk').values_list('pk', flat=True))
+        self.paginator = CursorPaginator(Blog.objects.all(), per_page=3)
+
+    def pks(self, page):
+        return [blog.pk for blog in page]
+
+    def test_forward_walk_visits_every_post_once(self):
+        page = self.paginator.page(None)
+        self.assertFalse(page.has_previous())
+        seen = self.pks(page)
+        while page.has_next():
+            page = self.paginator.page(page.next_cursor)
+            self.assertTrue(page.has_previous())
+            seen += self.pks(page)
+        self.assertEqual(seen, self.expected)
+
+    def test_backward_walk_returns_to_the_first_page(self):
+        pages = [self.paginator.page(None)]
+        while pages[-1].has_next():
+            pages.append(self.paginator.page(pages[-1].next_cursor))
+
+        page = pages[-1]
+        for previous in reversed(pages[:-1]):
+            page = self.paginator.page(page.previous_cursor)
+            self.assertEqual(self.pks(page), self.pks(previous))
+        self.assertFalse(page.has_previous())
+        self.assertEqual(self.pks(page), self.expected[:3])
+
+    def test_malformed_cursor_falls_back_to_first_page(self):
+        cursors = [
+            'garbage!!',
+            'not base64',
+            base64.urlsafe_b64encode(b'x|2024-01-01T00:00:00|1').decode(),
+            base64.urlsafe_b64encode(b'n|yesterday|1').decode(),
+            base64.urlsafe_b64encode(b'\xff\xfe').decode(),
+        ]
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                page = self.paginator.page(cursor)
+                self.assertEqual(self.pks(page), self.expected[:3])
+                self.assertFalse(page.has_previous())
 
-# Create your tests here.
+    def test_stale_previous_cursor_falls_back_to_first_page(self):
+        newest = Blog.objects.get(pk=self.expected[0])
+        page = self.paginator.page(self.paginator.encode_cursor('p', newest))
+        self.assertEqual(self.pks(page), self.expected[:3])
+        self.assertFalse(page.has_previous())
+        self.assertTrue(page.has_next())
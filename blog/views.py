@@ -1,13 +1,14 @@
 # --- Imports from your file ---
+from django.views.decorators.cache import cache_control
 from django.views.decorators.http import require_POST
-from django.views.decorators.csrf import csrf_exempt
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth import login, logout, authenticate, update_session_auth_hash
-from django.contrib.auth.decorators import login_required, user_passes_test
+from django.contrib.auth.decorators import login_required
+from django.contrib.auth.views import redirect_to_login
 from django.contrib import messages
-from django.core.mail import send_mail
 from django.conf import settings
-from django.db.models import Q, Avg, Count, QuerySet, Sum
+from django.db import transaction
+from django.db.models import Q, Avg, Count, OuterRef, QuerySet, Subquery, Sum, Prefetch
 from django.contrib.auth.models import User
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.urls import reverse
@@ -19,11 +20,16 @@ import json
 from functools import wraps
 
 # Import all models and forms used in the views
-from .models import Blog, Profile, Favorite, Rating, Category, ContactMessage, Comment, Like, Dislike
+from .models import (
+    Blog, Profile, Favorite, Rating, ContactMessage, Comment, Like, Dislike,
+    get_cached_categories, get_recent_blogs, get_sidebar_authors,
+)
 from .forms import (
     UserRegisterForm, UserUpdateForm, ProfileUpdateForm,
     BlogForm, RatingForm, ContactForm, CommentForm
 )
+from .emails import send_mail_async
+from .paginators import CachedCountPaginator, CursorPaginator
 
 
 # --- Custom Decorator ---
@@ -32,6 +38,7 @@ def author_or_staff_required(view_func):
     """
     A custom decorator to check if the user is the blog's author or a staff member.
     This prevents unnecessary permission checks within the views themselves.
+    The fetched blog is passed on to the view as the `blog` keyword argument.
     """
     @wraps(view_func)
     def _wrapped_view(request: HttpRequest, pk: int, *args, **kwargs) -> HttpResponse:
@@ -41,22 +48,48 @@ def author_or_staff_required(view_func):
             messages.error(request, 'The blog post you are trying to access does not exist.')
             return redirect('blog:blog_list')
 
-        if blog.author != request.user and not request.user.is_staff:
+        if blog.author_id != request.user.pk and not request.user.is_staff:
             messages.error(request, 'You can only edit or delete your own blogs.')
             return redirect('blog:blog_list')
         
-        return view_func(request, pk, *args, **kwargs)
+        return view_func(request, pk, *args, blog=blog, **kwargs)
+    return _wrapped_view
+
+
+def is_author_or_staff(user):
+    """Custom function to check if the user is an author or staff."""
+    # request.user lives for one request, so the answer is cached on it.
+    if not hasattr(user, '_is_author_or_staff'):
+        user._is_author_or_staff = user.is_staff or (hasattr(user, 'profile') and user.profile.user_type == 'author')
+    return user._is_author_or_staff
+
+
+def require_author_or_staff(view_func):
+    """
+    Combines login_required with the author/staff check in a single wrapper.
+    Anonymous users are sent to the login page, other non-authors back to the blog list.
+    """
+    @wraps(view_func)
+    def _wrapped_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if not request.user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        if not is_author_or_staff(request.user):
+            messages.error(request, 'Only authors can create blogs.')
+            return redirect('blog:blog_list')
+        return view_func(request, *args, **kwargs)
     return _wrapped_view
 
 
 # --- Public Views ---
 
+@cache_control(max_age=86400, public=True)
 def home(request: HttpRequest) -> HttpResponse:
     """
     Renders the homepage. Since `index.html` has been removed, this view now
-    simply redirects to the main blog list page.
+    simply redirects to the main blog list page. The redirect is permanent and
+    cacheable, so browsers and proxies stop asking after the first visit.
     """
-    return redirect('blog:blog_list')
+    return redirect('blog:blog_list', permanent=True)
 
 
 def blog_list(request: HttpRequest) -> HttpResponse:
@@ -64,11 +97,12 @@ def blog_list(request: HttpRequest) -> HttpResponse:
     Displays a list of all published blogs. It includes functionality to
     search, filter, and sort based on query parameters.
     """
-    blogs: QuerySet = Blog.objects.filter(published=True).select_related('author__profile').prefetch_related('categories')
+    blogs: QuerySet = Blog.objects.filter(published=True).for_listing().select_related('author__profile').prefetch_related('categories')
     
     query = request.GET.get('q')
     if query:
-        # Filter blogs by title, content, or author's username (case-insensitive)
+        # Filter blogs by title, content, or author's username (case-insensitive).
+        # On PostgreSQL these ILIKE filters use the pg_trgm indexes from migrations 0002 and 0010.
         blogs = blogs.filter(
             Q(title__icontains=query) |
             Q(content__icontains=query) |
@@ -83,38 +117,41 @@ def blog_list(request: HttpRequest) -> HttpResponse:
     if author_username:
         blogs = blogs.filter(author__username=author_username)
     
+    # Count before the per-viewer annotations, so every visitor shares one
+    # cached total and the COUNT carries no Exists subqueries.
+    filtered_blogs = blogs
+
+    # Annotate ratings and the user's own reactions once so the template
+    # doesn't query per blog.
+    blogs = blogs.with_avg_rating().with_user_reactions(request.user)
+    
     sort_by = request.GET.get('sort')
     if sort_by == 'rating':
         # Order by the average rating of each blog.
-        blogs = blogs.annotate(avg_rating=Avg('blog_ratings__score')).order_by('-avg_rating')
+        blogs = blogs.order_by('-_avg_rating')
+        
+        # Pagination - show 10 blogs per page; the total is cached briefly
+        paginator = CachedCountPaginator(blogs, 10, count_queryset=filtered_blogs)
+        page = request.GET.get('page')
+        
+        try:
+            blogs = paginator.page(page)
+        except PageNotAnInteger:
+            # If page is not an integer, deliver first page.
+            blogs = paginator.page(1)
+        except EmptyPage:
+            # If page is out of range, deliver last page of results.
+            blogs = paginator.page(paginator.num_pages)
     else:
-        # Default to sorting by creation date.
-        blogs = blogs.order_by('-created_at')
-    
-    # Pagination - show 10 blogs per page
-    paginator = Paginator(blogs, 10)
-    page = request.GET.get('page')
-    
-    try:
-        blogs = paginator.page(page)
-    except PageNotAnInteger:
-        # If page is not an integer, deliver first page.
-        blogs = paginator.page(1)
-    except EmptyPage:
-        # If page is out of range, deliver last page of results.
-        blogs = paginator.page(paginator.num_pages)
-    
-    # Get 5 most recent blogs for the sidebar.
-    recent_blogs = Blog.objects.filter(published=True).order_by('-created_at')[:5]
-    
-    categories = Category.objects.all()
-    authors = User.objects.filter(profile__user_type='author')
+        # Default to newest first, paginated by cursor so deep pages don't OFFSET.
+        blogs = CursorPaginator(blogs, 10).page(request.GET.get('cursor'))
     
+    # Sidebar lists are shared by every visitor, so they come from the cache.
     context = {
         'blogs': blogs,
-        'categories': categories,
-        'authors': authors,
-        'recent_blogs': recent_blogs,
+        'categories': get_cached_categories(),
+        'authors': get_sidebar_authors(),
+        'recent_blogs': get_recent_blogs(),
     }
     return render(request, 'blog/blog_list.html', context)
 
@@ -123,66 +160,74 @@ def blog_detail(request: HttpRequest, pk: int) -> HttpResponse:
     """
     Displays a single blog post and handles the submission of user ratings and comments.
     """
-    blog = get_object_or_404(Blog, pk=pk)
+    # Fetch the post together with its counts and the user's reactions in one query.
+    blog = get_object_or_404(
+        Blog.objects.with_avg_rating().with_user_reactions(request.user).select_related('author__profile'),
+        pk=pk,
+    )
     
-    is_favorited = False
-    user_rating = None
-    user_liked = False
-    user_disliked = False
+    comment_form = None
+    rating_form = None
     
-    if request.user.is_authenticated:
-        is_favorited = Favorite.objects.filter(user=request.user, blog=blog).exists()
-        try:
-            user_rating = Rating.objects.get(user=request.user, blog=blog)
-        except Rating.DoesNotExist:
-            pass
-        
-        # Check if user has liked or disliked the post
-        user_liked = Like.objects.filter(user=request.user, blog=blog).exists()
-        user_disliked = Dislike.objects.filter(user=request.user, blog=blog).exists()
-    
-    # Handle comment submission
-    if request.method == 'POST' and 'comment_form' in request.POST:
-        comment_form = CommentForm(request.POST)
-        if comment_form.is_valid() and request.user.is_authenticated:
-            # Get parent comment ID from form data if it exists for replies
-            parent_comment_id = request.POST.get('parent_comment_id')
-            parent_comment = None
-            if parent_comment_id:
-                try:
-                    parent_comment = Comment.objects.get(id=parent_comment_id)
-                except Comment.DoesNotExist:
-                    messages.error(request, 'Invalid comment to reply to.')
-                    return redirect('blog:blog_detail', pk=blog.pk)
-
-            new_comment = comment_form.save(commit=False)
-            new_comment.blog = blog
-            new_comment.user = request.user
-            new_comment.parent_comment = parent_comment
-            new_comment.save()
-            messages.success(request, 'Your comment has been posted!')
-            return redirect('blog:blog_detail', pk=blog.pk)
-        else:
+    # Handle comment and rating submissions, building only the submitted form
+    if request.method == 'POST':
+        if not request.user.is_authenticated:
+            if 'comment_form' in request.POST:
+                messages.error(request, 'There was an error posting your comment.')
+        elif 'comment_form' in request.POST:
+            comment_form = CommentForm(request.POST)
+            if comment_form.is_valid():
+                # Get parent comment ID from form data if it exists for replies
+                parent_comment_id = request.POST.get('parent_comment_id')
+                parent_comment = None
+                if parent_comment_id:
+                    try:
+                        parent_comment = Comment.objects.get(id=parent_comment_id)
+                    except Comment.DoesNotExist:
+                        messages.error(request, 'Invalid comment to reply to.')
+                        return redirect('blog:blog_detail', pk=blog.pk)
+
+                new_comment = comment_form.save(commit=False)
+                new_comment.blog = blog
+                new_comment.user = request.user
+                new_comment.parent_comment = parent_comment
+                new_comment.save()
+                messages.success(request, 'Your comment has been posted!')
+                return redirect('blog:blog_detail', pk=blog.pk)
             messages.error(request, 'There was an error posting your comment.')
-    else:
-        comment_form = CommentForm()
+        elif 'rating_form' in request.POST:
+            rating_form = RatingForm(request.POST)
+            if rating_form.is_valid():
+                Rating.objects.update_or_create(
+                    user=request.user,
+                    blog=blog,
+                    defaults={'score': rating_form.cleaned_data['score']}
+                )
+                messages.success(request, 'Your rating has been saved!')
+                return redirect('blog:blog_detail', pk=blog.pk)
     
-    # Handle rating submission
-    if request.method == 'POST' and 'rating_form' in request.POST and request.user.is_authenticated:
-        rating_form = RatingForm(request.POST)
-        if rating_form.is_valid():
-            Rating.objects.update_or_create(
-                user=request.user,
-                blog=blog,
-                defaults={'score': rating_form.cleaned_data['score']}
-            )
-            messages.success(request, 'Your rating has been saved!')
-            return redirect('blog:blog_detail', pk=blog.pk)
-    else:
+    user_rating = None
+    if request.user.is_authenticated:
+        user_rating = Rating.objects.filter(user=request.user, blog=blog).first()
+    
+    # Unbound forms for whatever wasn't submitted
+    if comment_form is None:
+        comment_form = CommentForm()
+    if rating_form is None:
         rating_form = RatingForm(instance=user_rating)
     
-    # Get all comments for the blog post (only top-level comments)
-    comments = Comment.objects.filter(blog=blog, parent_comment=None).order_by('-created_at')
+    # Get all comments for the blog post (only top-level comments), loading
+    # commenters and replies up front rather than per comment in the template.
+    comments = Comment.objects.filter(blog=blog, parent_comment=None).select_related(
+        'user__profile'
+    ).prefetch_related(
+        # Replies read oldest first, as a conversation.
+        Prefetch(
+            'replies',
+            queryset=Comment.objects.select_related('user__profile').order_by('created_at'),
+            to_attr='replies_cached',
+        )
+    ).order_by('-created_at')
     
     # Paginate comments - show 10 comments per page
     comment_paginator = Paginator(comments, 10)
@@ -197,19 +242,18 @@ def blog_detail(request: HttpRequest, pk: int) -> HttpResponse:
         # If page is out of range, deliver last page of results.
         comments = comment_paginator.page(comment_paginator.num_pages)
     
-    # Get a few recent blogs for the sidebar or related section.
-    recent_blogs = Blog.objects.filter(published=True).order_by('-created_at')[:5]
-    
     context = {
         'blog': blog,
-        'is_favorited': is_favorited,
+        'is_favorited': blog.is_favorited,
         'rating_form': rating_form,
         'user_rating': user_rating,
-        'recent_blogs': recent_blogs,
+        # Sidebar lists are shared by every visitor, so they come from the cache.
+        'recent_blogs': get_recent_blogs(),
+        'categories': get_cached_categories(),
         'comments': comments,
         'comment_form': comment_form,
-        'user_liked': user_liked,
-        'user_disliked': user_disliked,
+        'user_liked': blog.user_liked,
+        'user_disliked': blog.user_disliked,
     }
     return render(request, 'blog/blog_detail.html', context)
 
@@ -218,16 +262,22 @@ def author_list(request: HttpRequest) -> HttpResponse:
     """
     Displays a list of all authors, including the count of blogs they have published.
     """
-    authors = User.objects.filter(profile__user_type='author').annotate(
+    # Ratings are averaged in a subquery so their join doesn't multiply the sums.
+    author_ratings = Rating.objects.filter(
+        blog__author=OuterRef('pk'), blog__published=True
+    ).order_by().values('blog__author').annotate(avg=Avg('score')).values('avg')
+    all_authors = User.objects.filter(profile__user_type='author')
+    authors = all_authors.annotate(
         blog_count=Count('blog_posts', filter=Q(blog_posts__published=True)),
-        total_likes=Count('blog_posts__like', filter=Q(blog_posts__published=True)),  # Changed from Sum to Count
-        total_comments=Count('blog_posts__comments', filter=Q(blog_posts__published=True)),  # Changed from Sum to Count
-        total_favorites=Count('blog_posts__favorited_by', filter=Q(blog_posts__published=True)),  # Changed from Sum to Count
-        avg_rating=Avg('blog_posts__blog_ratings__score', filter=Q(blog_posts__published=True))
+        total_likes=Sum('blog_posts__like_count', filter=Q(blog_posts__published=True)),
+        total_comments=Sum('blog_posts__comment_count', filter=Q(blog_posts__published=True)),
+        total_favorites=Sum('blog_posts__favorite_count', filter=Q(blog_posts__published=True)),
+        avg_rating=Subquery(author_ratings),
     ).order_by('username')
 
-    # Pagination - show 12 authors per page
-    paginator = Paginator(authors, 12)
+    # Pagination - show 12 authors per page; the total is cached briefly and
+    # counted without the per-author aggregates
+    paginator = CachedCountPaginator(authors, 12, count_queryset=all_authors)
     page = request.GET.get('page')
     
     try:
@@ -253,21 +303,26 @@ def author_detail(request: HttpRequest, pk: int) -> HttpResponse:
         return redirect('blog:author_list')
     
     # Get published blogs with aggregated data
-    blogs = Blog.objects.filter(author=author, published=True).annotate(
-        like_count=Count('like'),
-        dislike_count=Count('dislike'),
-        favorite_count=Count('favorited_by'),
-        comment_count=Count('comments')
-    ).order_by('-created_at')
-    
-    # Calculate totals for the author
-    total_likes = blogs.aggregate(total_likes=Sum('like_count'))['total_likes'] or 0
-    total_dislikes = blogs.aggregate(total_dislikes=Sum('dislike_count'))['total_dislikes'] or 0
-    total_favorites = blogs.aggregate(total_favorites=Sum('favorite_count'))['total_favorites'] or 0
-    total_comments = blogs.aggregate(total_comments=Sum('comment_count'))['total_comments'] or 0
+    author_blogs = Blog.objects.filter(author=author, published=True)
+    blogs = author_blogs.for_listing().with_avg_rating().order_by('-created_at')
+    
+    # Calculate totals for the author in a single query
+    totals = author_blogs.aggregate(
+        total_posts=Count('pk'),
+        total_likes=Sum('like_count'),
+        total_dislikes=Sum('dislike_count'),
+        total_favorites=Sum('favorite_count'),
+        total_comments=Sum('comment_count'),
+    )
+    total_likes = totals['total_likes'] or 0
+    total_dislikes = totals['total_dislikes'] or 0
+    total_favorites = totals['total_favorites'] or 0
+    total_comments = totals['total_comments'] or 0
     
     # Pagination - show 6 blogs per page
     paginator = Paginator(blogs, 6)
+    # The aggregate above already counted the posts, so skip the paginator's COUNT(*).
+    paginator.count = totals['total_posts']
     page = request.GET.get('page')
     
     try:
@@ -282,6 +337,7 @@ def author_detail(request: HttpRequest, pk: int) -> HttpResponse:
     context = {
         'author': author,
         'blogs': blogs,
+        'total_posts': totals['total_posts'],
         'total_likes': total_likes,
         'total_dislikes': total_dislikes,
         'total_favorites': total_favorites,
@@ -313,18 +369,12 @@ def register(request: HttpRequest) -> HttpResponse:
                 reverse('blog:verify_email', kwargs={'token': str(profile.verification_token)})
             )
             
-            try:
-                send_mail(
-                    'Verify your email for Blog App',
-                    f'Please click the following link to verify your email: {verification_link}',
-                    settings.DEFAULT_FROM_EMAIL,
-                    [user.email],
-                    fail_silently=False,
-                )
-                messages.success(request, 'Account created! Please check your email to verify your account.')
-            except Exception as e:
-                print(f"Failed to send verification email: {e}")
-                messages.warning(request, 'Account created, but we could not send a verification email. Please contact support.')
+            send_mail_async(
+                'Verify your email for Blog App',
+                f'Please click the following link to verify your email: {verification_link}',
+                [user.email],
+            )
+            messages.success(request, 'Account created! Please check your email to verify your account.')
             
             return redirect('blog:verify_email_sent')
     else:
@@ -337,18 +387,20 @@ def verify_email_sent_view(request: HttpRequest) -> HttpResponse:
     return render(request, 'blog/verify_email_sent.html')
 
 
-def verify_email(request: HttpRequest, token: str) -> HttpResponse:
+def verify_email(request: HttpRequest, token: uuid.UUID) -> HttpResponse:
     """
     Activates a user's account if the provided token is valid.
+    The <uuid:token> URL converter has already parsed the token.
     """
-    try:
-        profile = Profile.objects.get(verification_token=token)
-        profile.email_verified = True
-        profile.user.is_active = True
-        profile.user.save()
-        profile.save()
+    # Two targeted UPDATEs in one transaction, without loading either row first.
+    with transaction.atomic():
+        verified = Profile.objects.filter(verification_token=token).update(email_verified=True)
+        if verified:
+            User.objects.filter(profile__verification_token=token).update(is_active=True)
+    
+    if verified:
         messages.success(request, 'Email verified! You can now log in.')
-    except Profile.DoesNotExist:
+    else:
         messages.error(request, 'Invalid verification token.')
     
     return redirect('blog:login')
@@ -386,7 +438,7 @@ def profile(request: HttpRequest) -> HttpResponse:
     Allows a user to view and update their profile.
     """
     # Get user's blog posts for the management section
-    user_posts = Blog.objects.filter(author=request.user).order_by('-created_at')
+    user_posts = Blog.objects.filter(author=request.user).defer('content').with_avg_rating().order_by('-created_at')
     
     # Calculate total likes and dislikes for user's posts
     total_likes = Like.objects.filter(blog__author=request.user).count()
@@ -454,12 +506,7 @@ def password_change(request: HttpRequest) -> HttpResponse:
     return render(request, 'blog/password_change.html', context)
 
 
-def is_author_or_staff(user):
-    """Custom function to check if the user is an author or staff."""
-    return user.is_staff or (hasattr(user, 'profile') and user.profile.user_type == 'author')
-
-@login_required
-@user_passes_test(is_author_or_staff)
+@require_author_or_staff
 def blog_create(request: HttpRequest) -> HttpResponse:
     """
     Handles creating a new blog post.
@@ -483,13 +530,11 @@ def blog_create(request: HttpRequest) -> HttpResponse:
 
 @login_required
 @author_or_staff_required
-def blog_update(request: HttpRequest, pk: int) -> HttpResponse:
+def blog_update(request: HttpRequest, pk: int, blog: Blog) -> HttpResponse:
     """
     Handles updating an existing blog post.
     Only allows the author or a staff member to update the blog.
     """
-    blog = get_object_or_404(Blog, pk=pk)
-    
     if request.method == 'POST':
         # request.FILES is added here
         form = BlogForm(request.POST, request.FILES, instance=blog)
@@ -505,13 +550,11 @@ def blog_update(request: HttpRequest, pk: int) -> HttpResponse:
 
 @login_required
 @author_or_staff_required
-def blog_delete(request: HttpRequest, pk: int) -> HttpResponse:
+def blog_delete(request: HttpRequest, pk: int, blog: Blog) -> HttpResponse:
     """
     Handles deleting a blog post.
     Only allows the author or a staff member to delete the blog.
     """
-    blog = get_object_or_404(Blog, pk=pk)
-    
     if request.method == 'POST':
         blog.delete()
         messages.success(request, 'Blog deleted successfully!')
@@ -526,25 +569,17 @@ def toggle_favorite(request: HttpRequest, pk: int) -> HttpResponse:
     Adds or removes a blog post from a user's favorites and sends an email notification.
     """
     blog = get_object_or_404(Blog, pk=pk)
-    favorite, created = Favorite.objects.get_or_create(user=request.user, blog=blog)
     
-    if not created:
-        favorite.delete()
+    if not Favorite.toggle(request.user, blog):
         messages.success(request, 'Removed from favorites.')
     else:
         messages.success(request, 'Added to favorites!')
         # Send an email to the user.
-        try:
-            send_mail(
-                'New Favorite Added!',
-                f'You have successfully added "{blog.title}" to your favorites.',
-                settings.DEFAULT_FROM_EMAIL,
-                [request.user.email],
-                fail_silently=False,
-            )
-        except Exception as e:
-            print(f"Failed to send favorite email: {e}")
-            messages.warning(request, 'Blog was added to favorites, but we could not send you an email confirmation.')
+        send_mail_async(
+            'New Favorite Added!',
+            f'You have successfully added "{blog.title}" to your favorites.',
+            [request.user.email],
+        )
     
     return redirect('blog:blog_detail', pk=blog.pk)
 
@@ -552,20 +587,16 @@ def toggle_favorite(request: HttpRequest, pk: int) -> HttpResponse:
 @login_required
 def favorite_list(request: HttpRequest) -> HttpResponse:
     """Displays a list of all blogs favorited by the logged-in user."""
-    favorites = Favorite.objects.filter(user=request.user).order_by('-created_at')
+    favorites = Favorite.objects.filter(user=request.user).prefetch_related(
+        Prefetch(
+            'blog',
+            queryset=Blog.objects.for_listing().with_avg_rating().select_related('author__profile'),
+        ),
+        'blog__categories',
+    )
     
-    # Pagination - show 12 favorites per page
-    paginator = Paginator(favorites, 12)
-    page = request.GET.get('page')
-    
-    try:
-        favorites = paginator.page(page)
-    except PageNotAnInteger:
-        # If page is not an integer, deliver first page.
-        favorites = paginator.page(1)
-    except EmptyPage:
-        # If page is out of range, deliver last page of results.
-        favorites = paginator.page(paginator.num_pages)
+    # Pagination - show 12 favorites per page, newest first by cursor
+    favorites = CursorPaginator(favorites, 12).page(request.GET.get('cursor'))
     
     return render(request, 'blog/favorite_list.html', {'favorites': favorites})
 
@@ -582,19 +613,14 @@ def contact(request: HttpRequest) -> HttpResponse:
         if form.is_valid():
             contact_message = form.save()
             
-            try:
-                send_mail(
-                    f'New Contact Message from {contact_message.name}',
-                    f"Name: {contact_message.name}\nEmail: {contact_message.email}\n\nMessage:\n{contact_message.message}",
-                    settings.DEFAULT_FROM_EMAIL,
-                    [settings.CONTACT_EMAIL], # This email should be defined in your settings.py file.
-                    fail_silently=False,
-                )
-                messages.success(request, 'Your message was sent successfully! We will get back to you shortly.')
-                return redirect('blog:contact_success')
-            except Exception as e:
-                print(f"Failed to send contact email: {e}")
-                messages.error(request, 'There was an error sending your message. Please try again later.')
+            # The message is already saved, so the notification can go out in the background.
+            send_mail_async(
+                f'New Contact Message from {contact_message.name}',
+                f"Name: {contact_message.name}\nEmail: {contact_message.email}\n\nMessage:\n{contact_message.message}",
+                [settings.CONTACT_EMAIL], # This email should be defined in your settings.py file.
+            )
+            messages.success(request, 'Your message was sent successfully! We will get back to you shortly.')
+            return redirect('blog:contact_success')
         else:
             messages.error(request, 'Please correct the errors below.')
         
@@ -615,16 +641,14 @@ def contact_success(request: HttpRequest) -> HttpResponse:
 
 @login_required
 @author_or_staff_required
-def publish_post(request: HttpRequest, pk: int) -> HttpResponse:
+def publish_post(request: HttpRequest, pk: int, blog: Blog) -> HttpResponse:
     """
     Publishes a blog post (sets published=True).
     Only allows the author or a staff member to publish the blog.
     """
-    blog = get_object_or_404(Blog, pk=pk)
-    
     if request.method == 'POST':
         blog.published = True
-        blog.save()
+        blog.save(update_fields=['published', 'updated_at'])
         messages.success(request, 'Blog published successfully!')
     
     return redirect('blog:blog_detail', pk=blog.pk)
@@ -632,16 +656,14 @@ def publish_post(request: HttpRequest, pk: int) -> HttpResponse:
 
 @login_required
 @author_or_staff_required
-def unpublish_post(request: HttpRequest, pk: int) -> HttpResponse:
+def unpublish_post(request: HttpRequest, pk: int, blog: Blog) -> HttpResponse:
     """
     Unpublishes a blog post (sets published=False).
     Only allows the author or a staff member to unpublish the blog.
     """
-    blog = get_object_or_404(Blog, pk=pk)
-    
     if request.method == 'POST':
         blog.published = False
-        blog.save()
+        blog.save(update_fields=['published', 'updated_at'])
         messages.success(request, 'Blog unpublished successfully!')
     
     return redirect('blog:blog_detail', pk=blog.pk)
@@ -649,61 +671,54 @@ def unpublish_post(request: HttpRequest, pk: int) -> HttpResponse:
 
 # --- Like/Dislike Views ---
 
+REACTIONS = ('like', 'dislike')
+
 @require_POST
-@csrf_exempt
 def like_dislike_post(request, pk):
     """
     Handles AJAX requests for liking and disliking blog posts.
+    The page's script sends the CSRF token in the X-CSRFToken header.
     """
     if not request.user.is_authenticated:
         return JsonResponse({'status': 'error', 'message': 'Authentication required'}, status=403)
     
     try:
-        blog = Blog.objects.get(pk=pk)
+        blog = Blog.objects.only('pk').get(pk=pk)
     except Blog.DoesNotExist:
         return JsonResponse({'status': 'error', 'message': 'Blog post not found'}, status=404)
     
-    # Get reaction type from request
-    data = json.loads(request.body)
-    reaction = data.get('reaction')
-    
-    if reaction == 'like':
-        # Check if user already liked
-        like_exists = Like.objects.filter(user=request.user, blog=blog).exists()
-        dislike_exists = Dislike.objects.filter(user=request.user, blog=blog).exists()
-        
-        if like_exists:
-            # Remove like if already exists
-            Like.objects.filter(user=request.user, blog=blog).delete()
-        else:
-            # Add like and remove dislike if exists
-            Like.objects.create(user=request.user, blog=blog)
-            if dislike_exists:
+    # Get reaction type from request, rejecting anything malformed up front
+    try:
+        data = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'status': 'error', 'message': 'Invalid JSON body'}, status=400)
+    reaction = data.get('reaction') if isinstance(data, dict) else None
+    if reaction not in REACTIONS:
+        return JsonResponse({'status': 'error', 'message': 'Reaction must be "like" or "dislike"'}, status=400)
+    
+    # Apply the toggle and its opposite removal together.
+    with transaction.atomic():
+        if reaction == 'like':
+            # Toggle the like; adding one replaces any existing dislike.
+            if Like.toggle(request.user, blog):
                 Dislike.objects.filter(user=request.user, blog=blog).delete()
-        
-    elif reaction == 'dislike':
-        # Check if user already disliked
-        dislike_exists = Dislike.objects.filter(user=request.user, blog=blog).exists()
-        like_exists = Like.objects.filter(user=request.user, blog=blog).exists()
-        
-        if dislike_exists:
-            # Remove dislike if already exists
-            Dislike.objects.filter(user=request.user, blog=blog).delete()
+            
         else:
-            # Add dislike and remove like if exists
-            Dislike.objects.create(user=request.user, blog=blog)
-            if like_exists:
+            # Toggle the dislike; adding one replaces any existing like.
+            if Dislike.toggle(request.user, blog):
                 Like.objects.filter(user=request.user, blog=blog).delete()
     
-    # Get updated counts
-    likes_count = blog.like_set.count()
-    dislikes_count = blog.dislike_set.count()
+    # Read the updated counts and the user's current reaction in one query
+    state = Blog.objects.filter(pk=blog.pk).with_user_reactions(request.user).values(
+        'like_count', 'dislike_count', 'user_liked', 'user_disliked'
+    ).get()
+    likes_count = state['like_count']
+    dislikes_count = state['dislike_count']
     
-    # Check user's current reaction
     user_reaction = None
-    if Like.objects.filter(user=request.user, blog=blog).exists():
+    if state['user_liked']:
         user_reaction = 'like'
-    elif Dislike.objects.filter(user=request.user, blog=blog).exists():
+    elif state['user_disliked']:
         user_reaction = 'dislike'
     
     return JsonResponse({
@@ -54,6 +54,11 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Same as ModelBackend, but fetches the session user with their profile.
+# Keep it the only backend: authenticate() tries every listed backend in turn,
+# so a second ModelBackend would hash the password again on each failed login.
+AUTHENTICATION_BACKENDS = ["blog.backends.ProfileModelBackend"]
+
 ROOT_URLCONF = "blog_site.urls"
 
 TEMPLATES = [
@@ -82,6 +87,19 @@ DATABASES = {
     }
 }
 
+# Cache
+# The default local-memory cache is per process, so with several workers a
+# post_save invalidation only clears the worker that handled the write and the
+# others keep serving their copy until the 60s sidebar TTL expires. Point
+# CACHE_BACKEND/CACHE_LOCATION at a shared backend (e.g.
+# django.core.cache.backends.redis.RedisCache) to invalidate everywhere.
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -116,6 +134,8 @@ EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
+# Seconds before a stalled SMTP connection gives up, so it cannot pin the mail threads.
+EMAIL_TIMEOUT = 10
 EMAIL_HOST_USER = config("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL")